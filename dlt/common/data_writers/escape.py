@@ -1,7 +1,8 @@
 import re
 import base64
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 from datetime import date, datetime, time  # noqa: I251
+from decimal import Decimal
 
 from dlt.common.json import json
 from dlt.common.pendulum import pendulum
@@ -21,9 +22,23 @@ def _make_sql_escape_re(escape_dict: Dict[str, str]) -> re.Pattern:  # type: ign
 SQL_ESCAPE_RE = _make_sql_escape_re(SQL_ESCAPE_DICT)
 
 
+def _make_sql_escape_table(escape_dict: Dict[str, str]) -> Dict[int, str]:
+    """Creates `str.translate` table. Escapes single characters in one pass without regex callbacks"""
+    return str.maketrans(escape_dict)  # type: ignore[arg-type]
+
+
+SQL_ESCAPE_TABLE = _make_sql_escape_table(SQL_ESCAPE_DICT)
+
+
 def _escape_extended(
-    v: str, prefix: str = "E'", escape_dict: Dict[str, str] = None, escape_re: re.Pattern = None  # type: ignore[type-arg]
+    v: str,
+    prefix: str = "E'",
+    escape_dict: Dict[str, str] = None,
+    escape_re: re.Pattern = None,  # type: ignore[type-arg]
+    escape_table: Dict[int, str] = None,
 ) -> str:
+    if escape_table is not None:
+        return prefix + v.translate(escape_table) + "'"
     escape_dict = escape_dict or SQL_ESCAPE_DICT
     escape_re = escape_re or SQL_ESCAPE_RE
     return "{}{}{}".format(prefix, escape_re.sub(lambda x: escape_dict[x.group(0)], v), "'")
@@ -34,13 +49,15 @@ def escape_redshift_literal(v: Any) -> Any:
         # https://www.postgresql.org/docs/9.3/sql-syntax-lexical.html
         # looks like this is the only thing we need to escape for Postgres > 9.1
         # redshift keeps \ as escape character which is pre 9 behavior
-        return _escape_extended(v, prefix="'")
+        return _escape_extended(v, prefix="'", escape_table=SQL_ESCAPE_TABLE)
     if isinstance(v, bytes):
         return f"from_hex('{v.hex()}')"
     if isinstance(v, (datetime, date, time)):
         return f"'{v.isoformat()}'"
     if isinstance(v, (list, dict)):
-        return "json_parse(%s)" % _escape_extended(json.dumps(v), prefix="'")
+        return "json_parse(%s)" % _escape_extended(
+            json.dumps(v), prefix="'", escape_table=SQL_ESCAPE_TABLE
+        )
     if v is None:
         return "NULL"
 
@@ -50,11 +67,11 @@ def escape_redshift_literal(v: Any) -> Any:
 def escape_postgres_literal(v: Any) -> Any:
     if isinstance(v, str):
         # we escape extended string which behave like the redshift string
-        return _escape_extended(v)
+        return _escape_extended(v, escape_table=SQL_ESCAPE_TABLE)
     if isinstance(v, (datetime, date, time)):
         return f"'{v.isoformat()}'"
     if isinstance(v, (list, dict)):
-        return _escape_extended(json.dumps(v))
+        return _escape_extended(json.dumps(v), escape_table=SQL_ESCAPE_TABLE)
     if isinstance(v, bytes):
         return f"'\\x{v.hex()}'"
     if v is None:
@@ -66,11 +83,11 @@ def escape_postgres_literal(v: Any) -> Any:
 def escape_duckdb_literal(v: Any) -> Any:
     if isinstance(v, str):
         # we escape extended string which behave like the redshift string
-        return _escape_extended(v)
+        return _escape_extended(v, escape_table=SQL_ESCAPE_TABLE)
     if isinstance(v, (datetime, date, time)):
         return f"'{v.isoformat()}'"
     if isinstance(v, (list, dict)):
-        return _escape_extended(json.dumps(v))
+        return _escape_extended(json.dumps(v), escape_table=SQL_ESCAPE_TABLE)
     if isinstance(v, bytes):
         return f"from_base64('{base64.b64encode(v).decode('ascii')}')"
     if v is None:
@@ -103,19 +120,16 @@ MS_SQL_ESCAPE_DICT = {
     "\t": "' + CHAR(9) + N'",
 }
 MS_SQL_ESCAPE_RE = _make_sql_escape_re(MS_SQL_ESCAPE_DICT)
+MS_SQL_ESCAPE_TABLE = _make_sql_escape_table(MS_SQL_ESCAPE_DICT)
 
 
 def escape_mssql_literal(v: Any) -> Any:
     if isinstance(v, str):
-        return _escape_extended(
-            v, prefix="N'", escape_dict=MS_SQL_ESCAPE_DICT, escape_re=MS_SQL_ESCAPE_RE
-        )
+        return _escape_extended(v, prefix="N'", escape_table=MS_SQL_ESCAPE_TABLE)
     if isinstance(v, (datetime, date, time)):
         return f"'{v.isoformat()}'"
     if isinstance(v, (list, dict)):
-        return _escape_extended(
-            json.dumps(v), prefix="N'", escape_dict=MS_SQL_ESCAPE_DICT, escape_re=MS_SQL_ESCAPE_RE
-        )
+        return _escape_extended(json.dumps(v), prefix="N'", escape_table=MS_SQL_ESCAPE_TABLE)
     if isinstance(v, bytes):
         from dlt.destinations.impl.mssql.mssql import VARBINARY_MAX_N
 
@@ -210,6 +224,74 @@ def escape_clickhouse_identifier(v: str) -> str:
     return "`" + v.replace("`", "``").replace("\\", "\\\\") + "`"
 
 
+TLiteralEscaper = Callable[[Any], str]
+
+_NUMBER_TYPES = (int, float, Decimal)
+_TEMPORAL_TYPES = (datetime, date, time)
+
+
+def _make_text_escaper(prefix: str, escape_table: Dict[int, str]) -> Callable[[str], str]:
+    def _escape_text(v: str) -> str:
+        return prefix + v.translate(escape_table) + "'"
+
+    return _escape_text
+
+
+# escapers of `str` values for literal escape functions that format numbers with `str` and
+# dates/times with `isoformat`. only those may be specialized per column data type
+TEXT_LITERAL_ESCAPERS: Dict[TLiteralEscaper, Callable[[str], str]] = {
+    escape_redshift_literal: _make_text_escaper("'", SQL_ESCAPE_TABLE),
+    escape_postgres_literal: _make_text_escaper("E'", SQL_ESCAPE_TABLE),
+    escape_duckdb_literal: _make_text_escaper("E'", SQL_ESCAPE_TABLE),
+    escape_mssql_literal: _make_text_escaper("N'", MS_SQL_ESCAPE_TABLE),
+}
+
+
+def has_typed_literal_escapers(escape_literal: TLiteralEscaper) -> bool:
+    """Tells if `escape_literal` may be specialized per column data type"""
+    return escape_literal in TEXT_LITERAL_ESCAPERS
+
+
+def get_typed_literal_escaper(escape_literal: TLiteralEscaper, data_type: str) -> TLiteralEscaper:
+    """Returns literal escaper specialized for values of a column with `data_type`. Should be
+    compiled once per table schema. Values of unexpected Python types and NULLs are passed to
+    `escape_literal` so the output is always identical to the generic escaper.
+    """
+    escape_text = TEXT_LITERAL_ESCAPERS.get(escape_literal)
+    if escape_text is None:
+        return escape_literal
+
+    if data_type in ("bigint", "double", "decimal", "wei"):
+
+        def _escape_number(v: Any) -> str:
+            # exact type check excludes bool which is escaped differently ie. by mssql
+            if v.__class__ in _NUMBER_TYPES:
+                return str(v)
+            return escape_literal(v)  # type: ignore[no-any-return]
+
+        return _escape_number
+
+    if data_type in ("timestamp", "date", "time"):
+
+        def _escape_temporal(v: Any) -> str:
+            if isinstance(v, _TEMPORAL_TYPES):
+                return "'" + v.isoformat() + "'"
+            return escape_literal(v)  # type: ignore[no-any-return]
+
+        return _escape_temporal
+
+    if data_type == "text":
+
+        def _escape_str(v: Any) -> str:
+            if v.__class__ is str:
+                return escape_text(v)
+            return escape_literal(v)  # type: ignore[no-any-return]
+
+        return _escape_str
+
+    return escape_literal
+
+
 def format_datetime_literal(v: pendulum.DateTime, precision: int = 6, no_tz: bool = False) -> str:
     """Converts `v` to ISO string, optionally without timezone spec (in UTC) and with given `precision`"""
     if no_tz:
@@ -24,6 +24,11 @@ from dlt.common.data_writers.exceptions import (
     FileSpecNotFound,
     InvalidDataItem,
 )
+from dlt.common.data_writers.escape import (
+    TLiteralEscaper,
+    get_typed_literal_escaper,
+    has_typed_literal_escapers,
+)
 from dlt.common.data_writers.configuration import (
     CsvFormatConfiguration,
     CsvQuoting,
@@ -37,7 +42,7 @@ from dlt.common.destination import (
 from dlt.common.metrics import DataWriterMetrics
 from dlt.common.schema.typing import TTableSchemaColumns
 from dlt.common.schema.utils import is_nullable_column
-from dlt.common.typing import StrAny, TDataItem
+from dlt.common.typing import TDataItem
 
 
 if TYPE_CHECKING:
@@ -204,6 +209,7 @@ class InsertValuesWriter(DataWriter):
         super().__init__(f, caps)
         self._chunks_written = 0
         self._headers_lookup: Dict[str, int] = None
+        self._column_escapers: List[TLiteralEscaper] = None
         self.writer_type = caps.insert_values_writer_type
         if self.writer_type == "default":
             self.pre, self.post, self.sep = ("(", ")", ",\n")
@@ -216,6 +222,11 @@ class InsertValuesWriter(DataWriter):
         headers = columns_schema.keys()
         # dict lookup is always faster
         self._headers_lookup = {v: i for i, v in enumerate(headers)}
+        # compile literal escapers specialized for column data types once per table schema
+        self._column_escapers = [
+            get_typed_literal_escaper(self._caps.escape_literal, column.get("data_type"))
+            for column in columns_schema.values()
+        ]
         # do not write INSERT INTO command, this must be added together with table name by the loader
         self._f.write("INSERT INTO {}(")
         self._f.write(",".join(map(self._caps.escape_identifier, headers)))
@@ -230,26 +241,25 @@ class InsertValuesWriter(DataWriter):
         if len(items) == 0:
             return
 
-        def write_row(row: StrAny, last_row: bool = False) -> None:
-            output = ["NULL"] * len(self._headers_lookup)
+        headers_lookup = self._headers_lookup
+        escapers = self._column_escapers
+        null_row = ["NULL"] * len(headers_lookup)
+        pre, post = self.pre, self.post
+        rows: List[str] = []
+        for row in items:
+            output = null_row.copy()
             for n, v in row.items():
-                output[self._headers_lookup[n]] = self._caps.escape_literal(v)
-            self._f.write(self.pre)
-            self._f.write(",".join(output))
-            self._f.write(self.post)
-            if not last_row:
-                self._f.write(self.sep)
+                idx = headers_lookup[n]
+                output[idx] = escapers[idx](v)
+            rows.append(pre + ",".join(output) + post)
+        self._write_rows(rows)
 
+    def _write_rows(self, rows: Sequence[str]) -> None:
         # if next chunk add separator
         if self._chunks_written > 0:
             self._f.write(self.sep)
-
-        # write rows
-        for row in items[:-1]:
-            write_row(row)
-
         # write last row without separator so we can write footer eventually
-        write_row(items[-1], last_row=True)
+        self._f.write(self.sep.join(rows))
         self._chunks_written += 1
 
     def write_footer(self) -> None:
@@ -634,6 +644,38 @@ class ArrowToObjectAdapter:
 
 
 class ArrowToInsertValuesWriter(ArrowToObjectAdapter, InsertValuesWriter):
+    def write_data(self, items: Sequence[TDataItem]) -> None:
+        """Escapes arrow tables and batches column-wise. Integer columns are formatted by arrow
+        compute kernels if destination literal escaper permits it.
+        """
+        from dlt.common.libs.pyarrow import pyarrow
+
+        vectorize = has_typed_literal_escapers(self._caps.escape_literal)
+        headers = list(self._headers_lookup.keys())
+        pre, post = self.pre, self.post
+        for batch in items:
+            self.items_count += batch.num_rows
+            # do not write empty batches
+            if batch.num_rows == 0:
+                continue
+            null_column = ["NULL"] * batch.num_rows
+            column_names = set(batch.schema.names)
+            columns: List[Sequence[str]] = []
+            for name, escaper in zip(headers, self._column_escapers):
+                if name not in column_names:
+                    columns.append(null_column)
+                    continue
+                column = batch.column(name)
+                if vectorize and pyarrow.types.is_integer(column.type):
+                    columns.append(
+                        pyarrow.compute.fill_null(
+                            pyarrow.compute.cast(column, pyarrow.string()), "NULL"
+                        ).to_pylist()
+                    )
+                else:
+                    columns.append([escaper(v) for v in column.to_pylist()])
+            self._write_rows([pre + ",".join(values) + post for values in zip(*columns)])
+
     @classmethod
     def writer_spec(cls) -> FileWriterSpec:
         return cls.convert_spec(InsertValuesWriter)
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Union, List
+from typing import Any, Optional, Dict, Union, List
 from pathlib import Path
 
 from dlt import version, Pipeline
@@ -11,6 +11,7 @@ from dlt.common.exceptions import MissingDependencyException
 from dlt.common.storages import FilesystemConfiguration
 from dlt.common.utils import assert_min_pkg_version
 from dlt.destinations.impl.filesystem.filesystem import FilesystemClient
+from dlt.destinations.impl.filesystem.typing import DeltaMaintenanceSettings
 
 try:
     import deltalake
@@ -148,6 +149,72 @@ def merge_delta_table(
         ValueError(f'Merge strategy "{strategy}" not supported.')
 
 
+DEFAULT_DELTA_TARGET_FILE_SIZE = 100 * 1024 * 1024
+"""Target file size used by `deltalake` optimize if not set in table properties"""
+
+
+def maintain_delta_table(
+    table: DeltaTable,
+    schema: TTableSchema,
+    settings: DeltaMaintenanceSettings,
+    last_version: int = -1,
+) -> Dict[str, Any]:
+    """Compacts, checkpoints and vacuums Delta `table` if thresholds in `settings` are reached.
+
+    Files are z-ordered by columns with `cluster` hint instead of bin-packed if `z_order` is set.
+    `last_version` is the table version before the load, used to detect crossed checkpoint
+    intervals. Returns metrics of executed operations keyed by operation name.
+    """
+    metrics: Dict[str, Any] = {}
+    if _delta_table_needs_compaction(table, settings):
+        cluster_columns = get_columns_names_with_prop(schema, "cluster")
+        if settings.z_order and cluster_columns:
+            metrics["z_order"] = table.optimize.z_order(
+                cluster_columns, target_size=settings.target_file_size
+            )
+        else:
+            metrics["compact"] = table.optimize.compact(target_size=settings.target_file_size)
+    if settings.checkpoint_interval:
+        # new tables are not checkpointed at version 0
+        version, last_version = table.version(), max(last_version, 0)
+        if version // settings.checkpoint_interval > last_version // settings.checkpoint_interval:
+            table.create_checkpoint()
+            table.cleanup_metadata()
+            metrics["checkpoint"] = version
+    # vacuum only when files were removed from the table
+    compacted = "compact" in metrics or "z_order" in metrics
+    if settings.vacuum_retention_hours is not None and (
+        compacted or schema.get("write_disposition") == "replace"
+    ):
+        metrics["vacuum"] = table.vacuum(
+            retention_hours=settings.vacuum_retention_hours,
+            dry_run=False,
+            enforce_retention_duration=settings.vacuum_enforce_retention_duration,
+        )
+    return metrics
+
+
+def _delta_table_needs_compaction(table: DeltaTable, settings: DeltaMaintenanceSettings) -> bool:
+    if settings.compact_min_commits:
+        # history is returned newest first
+        history = table.history(limit=settings.compact_min_commits)
+        if len(history) >= settings.compact_min_commits and not any(
+            commit.get("operation") == "OPTIMIZE" for commit in history
+        ):
+            return True
+    if settings.compact_min_files:
+        target_size = settings.target_file_size or int(
+            table.metadata().configuration.get(
+                "delta.targetFileSize", DEFAULT_DELTA_TARGET_FILE_SIZE
+            )
+        )
+        sizes = table.get_add_actions(flatten=True).column("size_bytes")
+        small_files = pa.compute.sum(pa.compute.less(sizes, target_size)).as_py() or 0
+        if small_files >= settings.compact_min_files:
+            return True
+    return False
+
+
 def get_delta_tables(
     pipeline: Pipeline, *tables: str, schema_name: str = None
 ) -> Dict[str, DeltaTable]:
@@ -10,7 +10,12 @@ from dlt.common.destination.reference import (
 )
 
 from dlt.common.storages import FilesystemConfiguration
-from dlt.destinations.impl.filesystem.typing import TCurrentDateTime, TExtraPlaceholders
+from dlt.destinations.impl.filesystem.transfer import TransferSettings
+from dlt.destinations.impl.filesystem.typing import (
+    DeltaMaintenanceSettings,
+    TCurrentDateTime,
+    TExtraPlaceholders,
+)
 
 from dlt.destinations.path_utils import check_layout, get_unused_placeholders
 
@@ -22,6 +27,32 @@ class FilesystemDestinationClientConfiguration(FilesystemConfiguration, Destinat
     )
     current_datetime: Optional[TCurrentDateTime] = None
     extra_placeholders: Optional[TExtraPlaceholders] = None
+    max_upload_batch_bytes: int = 4 * 1024 * 1024
+    """Job files smaller than this are grouped into concurrent bulk uploads up to this total size. Set to 0 to upload each file separately"""
+    max_upload_batch_files: int = 64
+    """Max number of files in a single bulk upload"""
+    upload_batch_linger: float = 0.02
+    """Seconds a job file waits for other files to join its bulk upload"""
+    max_in_flight_uploads: int = 8
+    """Max number of concurrent bulk and multipart uploads"""
+    multipart_threshold: int = 64 * 1024 * 1024
+    """Job files of this size and larger are uploaded in concurrent chunks if filesystem supports it"""
+    multipart_chunk_size: int = 16 * 1024 * 1024
+    """Size of a single chunk in multipart upload"""
+    deltalake_compact_min_files: Optional[int] = None
+    """Compact Delta table after load when it has at least this many files smaller than target file size"""
+    deltalake_compact_min_commits: Optional[int] = None
+    """Compact Delta table after load when this many commits happened since the last optimize"""
+    deltalake_target_file_size: Optional[int] = None
+    """Target size of compacted Delta files. `deltalake` default is used if not set"""
+    deltalake_z_order: bool = True
+    """Z-order compacted Delta files by columns with `cluster` hint"""
+    deltalake_checkpoint_interval: Optional[int] = None
+    """Write Delta log checkpoint and clean up expired log entries every that many table versions"""
+    deltalake_vacuum_retention_hours: Optional[int] = None
+    """Vacuum files removed from Delta table longer than that many hours ago. Runs after compaction and `replace` loads"""
+    deltalake_vacuum_enforce_retention_duration: bool = True
+    """Fail vacuum if retention is shorter than Delta table retention duration"""
 
     @resolve_type("credentials")
     def resolve_credentials_type(self) -> Type[CredentialsConfiguration]:
@@ -31,6 +62,27 @@ class FilesystemDestinationClientConfiguration(FilesystemConfiguration, Destinat
             or Optional[CredentialsConfiguration]  # type: ignore[return-value]
         )
 
+    def transfer_settings(self) -> TransferSettings:
+        return TransferSettings(
+            max_batch_bytes=self.max_upload_batch_bytes,
+            max_batch_files=self.max_upload_batch_files,
+            batch_linger=self.upload_batch_linger,
+            max_in_flight=self.max_in_flight_uploads,
+            multipart_threshold=self.multipart_threshold,
+            multipart_chunk_size=self.multipart_chunk_size,
+        )
+
+    def delta_maintenance_settings(self) -> DeltaMaintenanceSettings:
+        return DeltaMaintenanceSettings(
+            compact_min_files=self.deltalake_compact_min_files,
+            compact_min_commits=self.deltalake_compact_min_commits,
+            target_file_size=self.deltalake_target_file_size,
+            z_order=self.deltalake_z_order,
+            checkpoint_interval=self.deltalake_checkpoint_interval,
+            vacuum_retention_hours=self.deltalake_vacuum_retention_hours,
+            vacuum_enforce_retention_duration=self.deltalake_vacuum_enforce_retention_duration,
+        )
+
     def on_resolved(self) -> None:
         # Validate layout and show unused placeholders
         _, layout_placeholders = check_layout(self.layout, self.extra_placeholders)
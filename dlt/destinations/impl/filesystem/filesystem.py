@@ -61,6 +61,7 @@ from dlt.destinations.job_impl import (
     FinalizedLoadJobWithFollowupJobs,
 )
 from dlt.destinations.impl.filesystem.configuration import FilesystemDestinationClientConfiguration
+from dlt.destinations.impl.filesystem.transfer import FilesystemTransferEngine, get_transfer_engine
 from dlt.destinations import path_utils
 from dlt.destinations.fs_client import FSClientBase
 from dlt.destinations.dataset import ReadableDBAPIDataset
@@ -89,7 +90,7 @@ class FilesystemLoadJob(RunnableLoadJob):
         if self.__is_local_filesystem:
             # use os.path for local file name
             self._job_client.fs_client.makedirs(os.path.dirname(remote_path), exist_ok=True)
-        self._job_client.fs_client.put_file(self._file_path, remote_path)
+        self._job_client.transfer_engine.upload(self._file_path, remote_path)
 
     def make_remote_path(self) -> str:
         """Returns path on the remote filesystem to which copy the file, without scheme. For local filesystem a native path is used"""
@@ -141,6 +142,7 @@ class DeltaLoadFilesystemJob(FilesystemLoadJob):
         )
         source_ds = pa.dataset.dataset(self.file_paths)
         delta_table = self._delta_table()
+        last_version = -1 if delta_table is None else delta_table.version()
 
         # explicitly check if there is data
         # (https://github.com/delta-io/delta-rs/issues/2686)
@@ -174,6 +176,26 @@ class DeltaLoadFilesystemJob(FilesystemLoadJob):
             f"Copied {self.file_paths} to delta table {self.make_remote_url()} [arrow buffer:"
             f" {pa.total_allocated_bytes()}]"
         )
+        self._maintain_delta_table(last_version)
+
+    def _maintain_delta_table(self, last_version: int) -> None:
+        from dlt.common.libs.deltalake import maintain_delta_table
+
+        settings = self._job_client.config.delta_maintenance_settings()
+        if not settings.enabled:
+            return
+        # data is already committed so failed maintenance does not fail the job
+        try:
+            metrics = maintain_delta_table(
+                self._delta_table(), self._load_table, settings, last_version
+            )
+            if metrics:
+                logger.info(f"Maintained delta table {self.make_remote_url()}: {metrics}")
+        except Exception as ex:
+            logger.warning(
+                f"Maintenance of delta table {self.make_remote_url()} failed and will be retried"
+                f" after the next load: {ex}"
+            )
 
     @property
     def _storage_options(self) -> Dict[str, str]:
@@ -274,6 +296,11 @@ class FilesystemClient(
     def sql_client(self, client: SqlClientBase[Any]) -> None:
         self._sql_client = client
 
+    @property
+    def transfer_engine(self) -> FilesystemTransferEngine:
+        """Uploads job files, shared by all clients using the same filesystem instance"""
+        return get_transfer_engine(self.fs_client, self.config.transfer_settings())
+
     def drop_storage(self) -> None:
         if self.is_storage_initialized():
             self.fs_client.rm(self.dataset_path, recursive=True)
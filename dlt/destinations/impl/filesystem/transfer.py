@@ -0,0 +1,162 @@
+import os
+import inspect
+import threading
+import weakref
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from fsspec import AbstractFileSystem
+from fsspec.asyn import AsyncFileSystem
+
+from dlt.common import logger
+
+
+class TransferSettings(NamedTuple):
+    max_batch_bytes: int
+    """Files smaller than this are grouped into bulk puts up to this total size, 0 disables batching"""
+    max_batch_files: int
+    """Max number of files in a single bulk put"""
+    batch_linger: float
+    """Seconds a file waits for other files to join its batch"""
+    max_in_flight: int
+    """Max number of concurrent bulk puts and multipart uploads"""
+    multipart_threshold: int
+    """Files of this size and larger are uploaded in concurrent chunks if filesystem supports it"""
+    multipart_chunk_size: int
+    """Size of a single chunk of multipart upload"""
+
+
+class _PendingUpload:
+    __slots__ = ("local_path", "remote_path", "size", "done", "exception")
+
+    def __init__(self, local_path: str, remote_path: str, size: int) -> None:
+        self.local_path = local_path
+        self.remote_path = remote_path
+        self.size = size
+        self.done = False
+        self.exception: Optional[BaseException] = None
+
+
+class FilesystemTransferEngine:
+    """Uploads job files to a filesystem on behalf of load jobs running in the loader thread pool.
+
+    Small files are queued and the thread that fills the batch (or whose file waited longer than
+    `batch_linger`) uploads the whole batch with a single `put` that async filesystems execute
+    concurrently. Other threads wait until their files are uploaded. Large files are uploaded
+    with concurrent multipart chunks if filesystem implementation accepts `max_concurrency`.
+    Number of concurrent uploads is bounded by `max_in_flight`.
+    """
+
+    def __init__(self, fs_client: AbstractFileSystem, settings: TransferSettings) -> None:
+        self.fs_client = fs_client
+        self.settings = settings
+        self.is_async = isinstance(fs_client, AsyncFileSystem)
+        self._in_flight = threading.BoundedSemaphore(max(1, settings.max_in_flight))
+        self._lock = threading.Condition()
+        self._queue: List[_PendingUpload] = []
+        self._queued_bytes = 0
+        self._multipart_kwargs = self._get_multipart_kwargs()
+
+    def upload(self, local_path: str, remote_path: str) -> None:
+        """Uploads `local_path` to `remote_path`. Blocks until file is uploaded and raises
+        the upload exception if upload failed.
+        """
+        size = os.path.getsize(local_path)
+        if self.settings.max_batch_bytes and size < self.settings.max_batch_bytes:
+            self._upload_batched(_PendingUpload(local_path, remote_path, size))
+        else:
+            with self._in_flight:
+                self._put_file(local_path, remote_path, size)
+
+    def _upload_batched(self, pending: _PendingUpload) -> None:
+        batch: List[_PendingUpload] = None
+        with self._lock:
+            self._queue.append(pending)
+            self._queued_bytes += pending.size
+            if (
+                len(self._queue) >= self.settings.max_batch_files
+                or self._queued_bytes >= self.settings.max_batch_bytes
+            ):
+                batch = self._take_batch()
+            else:
+                # wait for other thread to upload the batch or for linger to pass
+                self._lock.wait_for(lambda: pending.done, timeout=self.settings.batch_linger)
+                if not pending.done and pending in self._queue:
+                    batch = self._take_batch()
+        if batch is not None:
+            self._put_batch(batch)
+        with self._lock:
+            self._lock.wait_for(lambda: pending.done)
+        if pending.exception is not None:
+            raise pending.exception
+
+    def _take_batch(self) -> List[_PendingUpload]:
+        batch, self._queue, self._queued_bytes = self._queue, [], 0
+        return batch
+
+    def _put_batch(self, batch: List[_PendingUpload]) -> None:
+        try:
+            with self._in_flight:
+                if len(batch) == 1:
+                    self._put_file(batch[0].local_path, batch[0].remote_path, batch[0].size)
+                else:
+                    try:
+                        self.fs_client.put(
+                            [p.local_path for p in batch], [p.remote_path for p in batch]
+                        )
+                    except Exception as ex:
+                        # upload files one by one so only failed files report exceptions
+                        logger.warning(
+                            f"Bulk upload of {len(batch)} files failed with {ex}, uploading files"
+                            " one by one"
+                        )
+                        for p in batch:
+                            try:
+                                self._put_file(p.local_path, p.remote_path, p.size)
+                            except Exception as file_ex:
+                                p.exception = file_ex
+        except Exception as ex:
+            for p in batch:
+                p.exception = ex
+        finally:
+            with self._lock:
+                for p in batch:
+                    p.done = True
+                self._lock.notify_all()
+
+    def _put_file(self, local_path: str, remote_path: str, size: int) -> None:
+        if self._multipart_kwargs and size >= self.settings.multipart_threshold:
+            self.fs_client.put_file(local_path, remote_path, **self._multipart_kwargs)
+        else:
+            self.fs_client.put_file(local_path, remote_path)
+
+    def _get_multipart_kwargs(self) -> Dict[str, Any]:
+        """Gets arguments enabling concurrent multipart upload if `put_file` implementation
+        supports them (ie. s3fs, adlfs)"""
+        put_file = getattr(self.fs_client, "_put_file" if self.is_async else "put_file")
+        try:
+            params = inspect.signature(put_file).parameters
+        except (TypeError, ValueError):
+            return {}
+        if "max_concurrency" not in params:
+            return {}
+        kwargs: Dict[str, Any] = {"max_concurrency": max(1, self.settings.max_in_flight)}
+        if "chunksize" in params:
+            kwargs["chunksize"] = self.settings.multipart_chunk_size
+        return kwargs
+
+
+_ENGINES: "weakref.WeakKeyDictionary[AbstractFileSystem, Dict[TransferSettings, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_ENGINES_LOCK = threading.Lock()
+
+
+def get_transfer_engine(
+    fs_client: AbstractFileSystem, settings: TransferSettings
+) -> FilesystemTransferEngine:
+    """Returns transfer engine shared by all job clients using the same `fs_client` instance"""
+    with _ENGINES_LOCK:
+        engines = _ENGINES.setdefault(fs_client, {})
+        if settings not in engines:
+            engines[settings] = FilesystemTransferEngine(fs_client, settings)
+        return engines[settings]  # type: ignore[no-any-return]
@@ -1,4 +1,4 @@
-from typing import Callable, Dict, Union
+from typing import Callable, Dict, NamedTuple, Optional, Union
 
 from pendulum.datetime import DateTime
 from typing_extensions import TypeAlias
@@ -19,3 +19,32 @@ TExtraPlaceholders: TypeAlias = Dict[
     str, Union[Union[str, int, DateTime], TLayoutPlaceholderCallback]
 ]
 """Extra placeholders for filesystem layout"""
+
+
+class DeltaMaintenanceSettings(NamedTuple):
+    compact_min_files: Optional[int]
+    """Compact table when it has at least this many files smaller than `target_file_size`"""
+    compact_min_commits: Optional[int]
+    """Compact table when this many commits happened since the last optimize"""
+    target_file_size: Optional[int]
+    """Target size of compacted files, `deltalake` default is used if not set"""
+    z_order: bool
+    """Z-order compacted files by columns with `cluster` hint"""
+    checkpoint_interval: Optional[int]
+    """Write log checkpoint and clean up expired log entries every that many table versions"""
+    vacuum_retention_hours: Optional[int]
+    """Vacuum files removed from the table longer than that many hours ago"""
+    vacuum_enforce_retention_duration: bool
+    """Fail vacuum if `vacuum_retention_hours` is shorter than table retention duration"""
+
+    @property
+    def enabled(self) -> bool:
+        return any(
+            setting is not None
+            for setting in (
+                self.compact_min_files,
+                self.compact_min_commits,
+                self.checkpoint_interval,
+                self.vacuum_retention_hours,
+            )
+        )
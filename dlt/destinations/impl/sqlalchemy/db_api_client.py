@@ -336,6 +336,14 @@ class SqlalchemyClient(SqlClientBase[Connection]):
         with self._transaction():
             yield SqlaDbApiCursor(self._current_connection.execute(query, *args))  # type: ignore[call-overload, abstract]
 
+    @raise_database_error
+    def execute_driver_many(self, sql: str, rows: Sequence[Sequence[Any]]) -> None:
+        """Executes compiled `sql` with positional `rows` in a single `executemany` on the driver
+        cursor. Parameters are passed to the driver as is, without any sqlalchemy type processing.
+        """
+        with self._transaction():
+            self._current_connection.exec_driver_sql(sql, rows)  # type: ignore[arg-type]
+
     def get_existing_table(self, table_name: str) -> Optional[sa.Table]:
         """Get a table object from metadata if it exists"""
         key = self.dataset_name + "." + table_name
@@ -1,5 +1,6 @@
 from typing import IO, Any, Dict, Iterator, List, Sequence, TYPE_CHECKING, Optional
 import math
+import time
 
 import sqlalchemy as sa
 
@@ -8,6 +9,7 @@ from dlt.common.destination.reference import (
     HasFollowupJobs,
     PreparedTableSchema,
 )
+from dlt.common import logger
 from dlt.common.storages import FileStorage
 from dlt.common.json import json, PY_DATETIME_DECODERS
 from dlt.destinations.sql_jobs import SqlFollowupJob, SqlJobParams
@@ -16,9 +18,50 @@ from dlt.destinations.impl.sqlalchemy.db_api_client import SqlalchemyClient
 from dlt.destinations.impl.sqlalchemy.merge_job import SqlalchemyMergeFollowupJob
 
 if TYPE_CHECKING:
+    from dlt.common.libs.pyarrow import pyarrow as pa
     from dlt.destinations.impl.sqlalchemy.sqlalchemy_job_client import SqlalchemyJobClient
 
 
+class SqlalchemyBulkInsert:
+    """Insert statement compiled once per load job for a fixed list of table columns.
+
+    Chunks of rows are passed column-wise. Sqlalchemy bind processors of each column are applied
+    to whole columns and rows are sent with a single `executemany` on the driver cursor, which
+    lets the drivers use their native multi-row insert paths (sqlite, mysql). Dialects with named
+    paramstyles fall back to sqlalchemy `insert` executed with a list of dicts.
+    """
+
+    def __init__(self, sql_client: SqlalchemyClient, table: sa.Table) -> None:
+        self.sql_client = sql_client
+        self.table = table
+        self.column_names = [col.name for col in table.columns]
+        dialect = sql_client.dialect
+        compiled = table.insert().compile(dialect=dialect, column_keys=self.column_names)
+        self.native = bool(compiled.positional) and list(compiled.positiontup or []) == (
+            self.column_names
+        )
+        self.sql = compiled.string
+        self.bind_processors = [
+            col.type.dialect_impl(dialect).bind_processor(dialect) for col in table.columns
+        ]
+
+    def insert_columns(self, columns: Sequence[Sequence[Any]]) -> None:
+        """Inserts rows given as a list of columns ordered like `column_names`"""
+        if not columns or len(columns[0]) == 0:
+            return
+        if not self.native:
+            self.sql_client.execute_sql(
+                self.table.insert(),
+                [dict(zip(self.column_names, row)) for row in zip(*columns)],
+            )
+            return
+        processed = [
+            column if processor is None else [processor(v) for v in column]
+            for column, processor in zip(columns, self.bind_processors)
+        ]
+        self.sql_client.execute_driver_many(self.sql, list(zip(*processed)))
+
+
 class SqlalchemyJsonLInsertJob(RunnableLoadJob, HasFollowupJobs):
     def __init__(self, file_path: str, table: sa.Table) -> None:
         super().__init__(file_path)
@@ -29,38 +72,32 @@ class SqlalchemyJsonLInsertJob(RunnableLoadJob, HasFollowupJobs):
         return FileStorage.open_zipsafe_ro(self._file_path, "rb")
 
     def _iter_data_items(self) -> Iterator[Dict[str, Any]]:
-        all_cols = {col.name: None for col in self.table.columns}
         with FileStorage.open_zipsafe_ro(self._file_path, "rb") as f:
             for line in f:
                 # Decode date/time to py datetime objects. Some drivers have issues with pendulum objects
-                for item in json.typed_loadb(line, decoders=PY_DATETIME_DECODERS):
-                    # Fill any missing columns in item with None. Bulk insert fails when items have different keys
-                    if item.keys() != all_cols.keys():
-                        yield {**all_cols, **item}
-                    else:
-                        yield item
+                yield from json.typed_loadb(line, decoders=PY_DATETIME_DECODERS)
 
     def _iter_data_item_chunks(self) -> Iterator[Sequence[Dict[str, Any]]]:
+        # Rows are inserted with executemany so the query contains a single VALUES tuple of
+        # placeholders. Chunk size only bounds the memory used by the job
         max_rows = self._job_client.capabilities.max_rows_per_insert or math.inf
-        # Limit by max query length should not be needed,
-        # bulk insert generates an INSERT template with a single VALUES tuple of placeholders
-        # If any dialects don't do that we need to check the str length of the query
-        # TODO: Max params may not be needed. Limits only apply to placeholders in sql string (mysql/sqlite)
-        max_params = self._job_client.capabilities.max_query_parameters or math.inf
         chunk: List[Dict[str, Any]] = []
-        params_count = 0
         for item in self._iter_data_items():
-            if len(chunk) + 1 == max_rows or params_count + len(item) > max_params:
-                # Rotate chunk
+            chunk.append(item)
+            if len(chunk) >= max_rows:
                 yield chunk
                 chunk = []
-                params_count = 0
-            params_count += len(item)
-            chunk.append(item)
 
         if chunk:
             yield chunk
 
+    def _iter_column_chunks(self, column_names: Sequence[str]) -> Iterator[Sequence[List[Any]]]:
+        """Yields chunks of rows as lists of columns ordered like `column_names`. Columns missing
+        in an item are filled with None.
+        """
+        for chunk in self._iter_data_item_chunks():
+            yield [[item.get(name) for item in chunk] for name in column_names]
+
     def run(self) -> None:
         _sql_client = self._job_client.sql_client
         # Copy the table to the current dataset (i.e. staging) if needed
@@ -68,37 +105,57 @@ class SqlalchemyJsonLInsertJob(RunnableLoadJob, HasFollowupJobs):
         table = self.table.to_metadata(
             self.table.metadata, schema=_sql_client.dataset_name  # type: ignore[attr-defined]
         )
+        bulk_insert = SqlalchemyBulkInsert(_sql_client, table)
 
+        rows_count = 0
+        started_at = time.perf_counter()
         with _sql_client.begin_transaction():
-            for chunk in self._iter_data_item_chunks():
-                _sql_client.execute_sql(table.insert(), chunk)
+            for columns in self._iter_column_chunks(bulk_insert.column_names):
+                bulk_insert.insert_columns(columns)
+                rows_count += len(columns[0]) if columns else 0
+        elapsed = time.perf_counter() - started_at
+        logger.info(
+            f"Inserted {rows_count} rows into {table.fullname} in {elapsed:.3f}s"
+            f" ({rows_count / max(elapsed, 1e-9):.0f} rows/s)"
+        )
 
 
 class SqlalchemyParquetInsertJob(SqlalchemyJsonLInsertJob):
-    def _iter_data_item_chunks(self) -> Iterator[Sequence[Dict[str, Any]]]:
+    def _iter_record_batches(self) -> Iterator["pa.RecordBatch"]:
+        """Streams record batches from the job file. Batch size is bounded by
+        `max_rows_per_insert` and by `max_query_length` bytes estimated from the first row group
+        so memory stays bounded regardless of file size.
+        """
         from dlt.common.libs.pyarrow import ParquetFile
 
-        num_cols = len(self.table.columns)
-        max_rows = self._job_client.capabilities.max_rows_per_insert or None
-        max_params = self._job_client.capabilities.max_query_parameters or None
-        read_limit = None
-
+        caps = self._job_client.capabilities
         with ParquetFile(self._file_path) as reader:
-            if max_params is not None:
-                read_limit = math.floor(max_params / num_cols)
-
-            if max_rows is not None:
-                if read_limit is None:
-                    read_limit = max_rows
-                else:
-                    read_limit = min(read_limit, max_rows)
-
-            if read_limit is None:
-                yield reader.read().to_pylist()
-                return
-
-            for chunk in reader.iter_batches(batch_size=read_limit):
-                yield chunk.to_pylist()
+            batch_size = caps.max_rows_per_insert or None
+            metadata = reader.metadata
+            if caps.max_query_length and metadata.num_rows and metadata.num_row_groups:
+                row_group = metadata.row_group(0)
+                # uncompressed size per row of the first row group
+                row_size = max(1, row_group.total_byte_size // max(1, row_group.num_rows))
+                max_rows = max(1, caps.max_query_length // row_size)
+                batch_size = min(batch_size or max_rows, max_rows)
+            if batch_size is None:
+                batch_size = max(1, metadata.num_rows)
+            yield from reader.iter_batches(batch_size=batch_size)
+
+    def _iter_column_chunks(self, column_names: Sequence[str]) -> Iterator[Sequence[List[Any]]]:
+        for batch in self._iter_record_batches():
+            if batch.num_rows == 0:
+                continue
+            batch_columns = set(batch.schema.names)
+            # convert arrow columns to python lists column-wise, missing columns are NULL
+            yield [
+                (
+                    batch.column(name).to_pylist()
+                    if name in batch_columns
+                    else [None] * batch.num_rows
+                )
+                for name in column_names
+            ]
 
 
 class SqlalchemyStagingCopyJob(SqlFollowupJob):
@@ -138,6 +195,7 @@ class SqlalchemyStagingCopyJob(SqlFollowupJob):
 
 
 __all__ = [
+    "SqlalchemyBulkInsert",
     "SqlalchemyJsonLInsertJob",
     "SqlalchemyParquetInsertJob",
     "SqlalchemyStagingCopyJob",
@@ -14,6 +14,8 @@ from dlt.common.data_writers.escape import (
     escape_redshift_literal,
     escape_postgres_literal,
     escape_duckdb_literal,
+    escape_mssql_literal,
+    get_typed_literal_escaper,
 )
 
 # import all writers here to check if it can be done without all the dependencies
@@ -119,6 +121,74 @@ def test_unicode_insert_writer(insert_writer: _StringIOWriter) -> None:
     assert lines[5].endswith("hello\\nworld\t\t\t\\r\x06'),")
 
 
+@pytest.mark.parametrize(
+    "escaper", ALL_LITERAL_ESCAPE + [escape_mssql_literal], ids=lambda e: e.__name__
+)
+def test_typed_literal_escaper(escaper: AnyFun) -> None:
+    from decimal import Decimal
+
+    values = [
+        None,
+        True,
+        False,
+        1,
+        -2**63,
+        1.5,
+        float("nan"),
+        Decimal("1.10"),
+        "",
+        ", NULL');\n DROP TABLE --\\\r\t",
+        "イロハニホヘト",
+        b"bytes",
+        pendulum.from_timestamp(1658928602.575267),
+        pendulum.date(1974, 8, 11),
+        pendulum.time(12, 1, 59),
+        {"a": "b'"},
+        ["a", 1],
+    ]
+    if escaper is escape_mssql_literal:
+        # binary escape requires mssql dependencies
+        values.remove(b"bytes")
+    # typed escapers must produce the same output as generic one for any value
+    for data_type in ["text", "bigint", "double", "decimal", "bool", "timestamp", "date", "json"]:
+        typed_escaper = get_typed_literal_escaper(escaper, data_type)
+        for value in values:
+            assert typed_escaper(value) == escaper(value), (data_type, value)
+
+
+def test_insert_writer_arrow_column_wise() -> None:
+    import pyarrow as pa
+    from dlt.destinations import duckdb
+
+    caps = duckdb().capabilities()
+    columns = {
+        "id": {"name": "id", "data_type": "bigint"},
+        "value": {"name": "value", "data_type": "double"},
+        "name": {"name": "name", "data_type": "text"},
+        "ts": {"name": "ts", "data_type": "timestamp"},
+        "missing": {"name": "missing", "data_type": "text"},
+    }
+    rows = [
+        {"id": 1, "value": 1.5, "name": "a'b\n", "ts": pendulum.from_timestamp(1658928602)},
+        {"id": None, "value": None, "name": None, "ts": None},
+    ]
+    table = pa.Table.from_pylist(rows)
+
+    with io.StringIO() as f:
+        writer = InsertValuesWriter(f, caps=caps)
+        writer.write_all(columns, [dict(row) for row in rows] * 2)
+        expected = f.getvalue()
+
+    with io.StringIO() as f:
+        arrow_writer = ArrowToInsertValuesWriter(f, caps=caps)
+        arrow_writer.write_header(columns)
+        arrow_writer.write_data([table, table.slice(0, 0)])
+        arrow_writer.write_data([table.to_batches()[0]])
+        arrow_writer.write_footer()
+        assert arrow_writer.items_count == 4
+        assert f.getvalue() == expected
+
+
 def test_string_literal_escape() -> None:
     assert escape_redshift_literal(", NULL'); DROP TABLE --") == "', NULL''); DROP TABLE --'"
     assert escape_redshift_literal(", NULL');\n DROP TABLE --") == "', NULL'');\\n DROP TABLE --'"
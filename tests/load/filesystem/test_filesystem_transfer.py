@@ -0,0 +1,130 @@
+import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+from unittest import mock
+
+import fsspec
+import pytest
+
+from dlt.common.utils import uniq_id
+from dlt.destinations.impl.filesystem.configuration import (
+    FilesystemDestinationClientConfiguration,
+)
+from dlt.destinations.impl.filesystem.transfer import (
+    FilesystemTransferEngine,
+    TransferSettings,
+    get_transfer_engine,
+)
+
+from tests.utils import TEST_STORAGE_ROOT, clean_test_storage
+
+
+@pytest.fixture(autouse=True)
+def storage() -> None:
+    clean_test_storage()
+
+
+def _settings(**kwargs) -> TransferSettings:
+    settings = FilesystemDestinationClientConfiguration().transfer_settings()
+    return settings._replace(**kwargs)
+
+
+def _make_local_files(count: int, size: int) -> List[str]:
+    local_dir = os.path.join(TEST_STORAGE_ROOT, "transfer_" + uniq_id())
+    os.makedirs(local_dir)
+    paths = []
+    for i in range(count):
+        path = os.path.join(local_dir, f"file_{i}.jsonl")
+        with open(path, "wb") as f:
+            f.write(bytes([i % 256]) * size)
+        paths.append(path)
+    return paths
+
+
+def _remote_paths(fs: fsspec.AbstractFileSystem, local_paths: List[str]) -> List[str]:
+    if "memory" in fs.protocol:
+        remote_dir = "/transfer_" + uniq_id()
+        return [posixpath.join(remote_dir, os.path.basename(p)) for p in local_paths]
+    remote_dir = os.path.abspath(os.path.join(TEST_STORAGE_ROOT, "remote_" + uniq_id()))
+    os.makedirs(remote_dir)
+    return [os.path.join(remote_dir, os.path.basename(p)) for p in local_paths]
+
+
+def _upload_concurrently(
+    engine: FilesystemTransferEngine, pairs: List[Tuple[str, str]], workers: int = 16
+) -> None:
+    with ThreadPoolExecutor(workers) as pool:
+        for f in [pool.submit(engine.upload, lp, rp) for lp, rp in pairs]:
+            f.result()
+
+
+@pytest.mark.parametrize("protocol", ["memory", "file"])
+def test_small_files_batched(protocol: str) -> None:
+    fs = fsspec.filesystem(protocol)
+    engine = FilesystemTransferEngine(
+        fs, _settings(max_batch_files=8, batch_linger=0.5, max_batch_bytes=1024 * 1024)
+    )
+    local_paths = _make_local_files(32, 128)
+    remote_paths = _remote_paths(fs, local_paths)
+
+    with mock.patch.object(fs, "put", wraps=fs.put) as put_spy:
+        _upload_concurrently(engine, list(zip(local_paths, remote_paths)))
+
+    # files were uploaded in bulk puts
+    assert 0 < put_spy.call_count < len(local_paths)
+    for local_path, remote_path in zip(local_paths, remote_paths):
+        with open(local_path, "rb") as f:
+            assert fs.cat_file(remote_path) == f.read()
+
+
+def test_batching_disabled_and_large_files() -> None:
+    fs = fsspec.filesystem("memory")
+    # files larger than byte budget are uploaded one by one
+    engine = FilesystemTransferEngine(fs, _settings(max_batch_bytes=64))
+    local_paths = _make_local_files(4, 128)
+    remote_paths = _remote_paths(fs, local_paths)
+    with mock.patch.object(fs, "put", wraps=fs.put) as put_spy:
+        _upload_concurrently(engine, list(zip(local_paths, remote_paths)))
+    assert put_spy.call_count == 0
+    assert all(fs.exists(p) for p in remote_paths)
+
+    # memory filesystem does not support concurrent multipart uploads
+    assert engine._multipart_kwargs == {}
+
+
+def test_failed_file_in_batch() -> None:
+    fs = fsspec.filesystem("memory")
+    engine = FilesystemTransferEngine(fs, _settings(max_batch_files=4, batch_linger=0.5))
+    local_paths = _make_local_files(4, 16)
+    remote_paths = _remote_paths(fs, local_paths)
+    # one of the local files disappeared before upload
+    missing_path = local_paths[1]
+
+    put_file = fs.put_file
+
+    def _put_file(lpath, rpath, **kwargs):
+        if lpath == missing_path:
+            raise FileNotFoundError(lpath)
+        return put_file(lpath, rpath, **kwargs)
+
+    with mock.patch.object(fs, "put_file", side_effect=_put_file):
+        with ThreadPoolExecutor(4) as pool:
+            futures = [
+                pool.submit(engine.upload, lp, rp) for lp, rp in zip(local_paths, remote_paths)
+            ]
+            results = [f.exception() for f in futures]
+
+    # only the job with failed file raises
+    assert isinstance(results[1], FileNotFoundError)
+    assert [r for i, r in enumerate(results) if i != 1] == [None, None, None]
+    assert not fs.exists(remote_paths[1])
+    assert fs.exists(remote_paths[0])
+
+
+def test_engine_shared_per_filesystem() -> None:
+    fs = fsspec.filesystem("memory")
+    settings = _settings()
+    engine = get_transfer_engine(fs, settings)
+    assert get_transfer_engine(fs, settings) is engine
+    assert get_transfer_engine(fs, settings._replace(max_in_flight=1)) is not engine
@@ -977,6 +977,66 @@ def test_delta_table_get_delta_tables_helper(
         get_delta_tables(pipeline, "aux_delta")
 
 
+@pytest.mark.parametrize(
+    "destination_config",
+    destinations_configs(
+        table_format_filesystem_configs=True,
+        with_table_format="delta",
+        bucket_subset=(FILE_BUCKET),
+    ),
+    ids=lambda x: x.name,
+)
+def test_delta_table_maintenance(
+    destination_config: DestinationTestConfiguration,
+    mocker: MockerFixture,
+) -> None:
+    """Tests compaction, z-ordering, checkpoints and vacuum after loads to `delta` table."""
+    from deltalake.table import TableOptimizer
+    from dlt.common.libs.deltalake import get_delta_tables
+
+    z_order_spy = mocker.spy(TableOptimizer, "z_order")
+    os.environ["DESTINATION__FILESYSTEM__DELTALAKE_COMPACT_MIN_FILES"] = "3"
+    os.environ["DESTINATION__FILESYSTEM__DELTALAKE_CHECKPOINT_INTERVAL"] = "2"
+    os.environ["DESTINATION__FILESYSTEM__DELTALAKE_VACUUM_RETENTION_HOURS"] = "0"
+    os.environ["DESTINATION__FILESYSTEM__DELTALAKE_VACUUM_ENFORCE_RETENTION_DURATION"] = "False"
+
+    @dlt.resource(table_format="delta", columns={"c1": {"cluster": True}})
+    def clustered(i: int):
+        yield [{"c1": i * 10 + j, "c2": i} for j in range(10)]
+
+    pipeline = destination_config.setup_pipeline("fs_pipe", dev_mode=True)
+
+    def _operations() -> List[str]:
+        dt = get_delta_tables(pipeline, "clustered")["clustered"]
+        return [commit["operation"] for commit in dt.history()]
+
+    for i in range(2):
+        assert_load_info(pipeline.run(clustered(i)))
+    assert "OPTIMIZE" not in _operations()
+    # third small file triggers z-order by cluster column
+    assert_load_info(pipeline.run(clustered(2)))
+    dt = get_delta_tables(pipeline, "clustered")["clustered"]
+    assert len(dt.files()) == 1
+    assert _operations()[:3] == ["VACUUM END", "VACUUM START", "OPTIMIZE"]
+    z_order_spy.assert_called_once()
+    assert list(z_order_spy.call_args[0][1]) == ["c1"]
+    assert dt.to_pyarrow_table().num_rows == 30
+    # compacted files were vacuumed
+    table_dir = pipeline.destination_client().get_table_dir("clustered")  # type: ignore[attr-defined]
+    data_files = [f for f in os.listdir(table_dir) if f.endswith(".parquet")]
+    assert len(data_files) == 1
+    # checkpoints were written
+    log_files = os.listdir(os.path.join(table_dir, "_delta_log"))
+    assert any(f.endswith(".checkpoint.parquet") for f in log_files)
+
+    # maintenance failures do not fail the load
+    mocker.patch(
+        "dlt.common.libs.deltalake.maintain_delta_table", side_effect=RuntimeError("fail")
+    )
+    assert_load_info(pipeline.run(clustered(3)))
+    assert load_table_counts(pipeline, "clustered")["clustered"] == 40
+
+
 @pytest.mark.parametrize(
     "destination_config",
     destinations_configs(
@@ -0,0 +1,99 @@
+import os
+from typing import Any, Dict, List
+
+import pytest
+import sqlalchemy as sa
+
+import dlt
+from dlt.common import pendulum
+from dlt.common.utils import uniq_id
+from dlt.destinations.impl.sqlalchemy.db_api_client import SqlalchemyClient
+from dlt.destinations.impl.sqlalchemy.load_jobs import SqlalchemyBulkInsert
+
+
+def _sqlite_pipeline(max_rows_per_insert: int) -> dlt.Pipeline:
+    destination = dlt.destinations.sqlalchemy(
+        credentials="sqlite:///_storage/bulk_insert.sqlite",
+        max_rows_per_insert=max_rows_per_insert,
+    )
+    return dlt.pipeline(
+        pipeline_name="bulk_insert_" + uniq_id(),
+        destination=destination,
+        dataset_name="bulk_insert_" + uniq_id(),
+    )
+
+
+def _make_rows(count: int) -> List[Dict[str, Any]]:
+    rows = []
+    for i in range(count):
+        row: Dict[str, Any] = {
+            "id": i,
+            "name": f"name_'{i}'",
+            "value": i * 1.5,
+            "created_at": pendulum.datetime(2024, 1, 1).add(seconds=i),
+        }
+        # some rows miss optional column
+        if i % 3 == 0:
+            row["optional"] = f"opt_{i}"
+        rows.append(row)
+    return rows
+
+
+@pytest.mark.parametrize("item_format", ["object", "arrow"])
+def test_bulk_insert_chunks(item_format: str) -> None:
+    os.makedirs("_storage", exist_ok=True)
+    pipeline = _sqlite_pipeline(max_rows_per_insert=7)
+    rows = _make_rows(100)
+    data: Any = rows
+    loader_file_format = "typed-jsonl"
+    if item_format == "arrow":
+        import pyarrow as pa
+
+        data = pa.Table.from_pylist(rows)
+        loader_file_format = "parquet"
+
+    info = pipeline.run(data, table_name="items", loader_file_format=loader_file_format)
+    info.raise_on_failed_jobs()
+
+    with pipeline.sql_client() as client:
+        loaded = client.execute_sql(
+            "SELECT id, name, value, optional FROM items ORDER BY id",
+        )
+    assert len(loaded) == 100
+    for row, (id_, name, value, optional) in zip(rows, loaded):
+        assert id_ == row["id"]
+        assert name == row["name"]
+        assert value == row["value"]
+        assert optional == row.get("optional")
+
+
+def test_bulk_insert_native_statement() -> None:
+    metadata = sa.MetaData()
+    table = sa.Table(
+        "items",
+        metadata,
+        sa.Column("id", sa.BigInteger),
+        sa.Column("odd name%", sa.Text),
+        sa.Column("created_at", sa.DateTime),
+    )
+    from dlt.destinations.impl.sqlalchemy.configuration import SqlalchemyCredentials
+
+    client = SqlalchemyClient(
+        "main",
+        "main_staging",
+        SqlalchemyCredentials("sqlite:///:memory:"),
+        dlt.destinations.sqlalchemy().capabilities(),
+    )
+    with client:
+        client.create_table(table)
+        bulk_insert = SqlalchemyBulkInsert(client, table)
+        # sqlite uses positional paramstyle so driver executemany is used
+        assert bulk_insert.native is True
+        assert bulk_insert.column_names == ["id", "odd name%", "created_at"]
+        now = pendulum.now().naive()
+        bulk_insert.insert_columns([[1, 2], ["a", None], [now, None]])
+        # bind processors were applied: datetime is read back via sqlalchemy result processors
+        assert client.execute_sql(table.select()) == [
+            (1, "a", now),
+            (2, None, None),
+        ]